@@ -62,6 +62,9 @@ class FollowTheLight(Task):
             # if no punishment is used, let the mouse choose again
             self.punish_condition = "stimulus_state"
 
+        # side port events used to find the first choice of every trial
+        self.side_port_events = frozenset(["Port1In", "Port3In"])
+
     def configure_gui(self):
         # TODO: implement this method
         pass
@@ -201,7 +204,7 @@ class FollowTheLight(Task):
         # get the side port that the mouse poked first
         first_poke = self.find_first_occurrence(
             self.trial_data["ordered_list_of_events"],
-            ["Port1In", "Port3In"],
+            self.side_port_events,
         )
         # check if the mouse poked the correct port
         if first_poke == "Port1In" and "left" in self.this_trial_type:
@@ -212,10 +215,12 @@ class FollowTheLight(Task):
             return False
         
     def find_first_occurrence(self, event_list, targets):
-        for event in event_list:
-            if event in targets:
-                return event
-        return "NaN"
+        """
+        Returns the first event in event_list that is one of the targets,
+        or "NaN" if none of them happened.
+        Pass targets as a set so each lookup is constant time.
+        """
+        return next((event for event in event_list if event in targets), "NaN")
 
 
 # Uncomment below if you want to programatically interact with
@@ -105,8 +105,10 @@ class TrainingSettings(Training):
             return None
 
         # get some information
+        # performance of every session, computed in a single pass over the data
+        session_performance = self.df.groupby("session", dropna=False).correct.mean()
         total_trials = self.df.shape[0]
-        total_sessions = len(self.df.session.unique())
+        total_sessions = len(session_performance)
 
         # define when to change tasks
         if self.last_task == "Habituation" and total_trials > 100 and total_sessions >= 2:
@@ -128,18 +130,15 @@ class TrainingSettings(Training):
                 self.settings.reward_amount_ml = 2
 
         # logic to promote the animal to the second training stage:
-        is_animal_in_hardest_stage = any(
-            item in self.df.trial_type.unique() for item in ["left_hard", "right_hard"]
-        )
+        is_animal_in_hardest_stage = self.df.trial_type.isin(
+            ["left_hard", "right_hard"]
+        ).any()
         if total_sessions >= 2 and not is_animal_in_hardest_stage:
-            last_session_performance = self.get_session_performance(total_sessions)
-            previous_session_performance = self.get_session_performance(
-                total_sessions - 1
-            )
-            if (
-                last_session_performance >= 0.85
-                and previous_session_performance >= 0.85
-            ):
+            # missing sessions give NaN, which never passes the threshold
+            last_two_sessions_performance = session_performance.reindex(
+                [total_sessions - 1, total_sessions]
+            ).to_numpy()
+            if (last_two_sessions_performance >= 0.85).all():
                 # introduce punishment
                 self.settings.punishment = True
                 # change the trial types
@@ -167,13 +166,6 @@ class TrainingSettings(Training):
 
         # TODO: define possible values for each variable?
 
-    def get_session_performance(self, session: int) -> float:
-        """
-        This method calculates the performance of a session.
-        """
-
-        return self.df[self.df.session == session].correct.mean()
-
 
 # for debugging purposes
 if __name__ == "__main__":